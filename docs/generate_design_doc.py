@@ -361,7 +361,7 @@ def build_document():
     doc.add_heading("5.1 Star Schema Design", level=2)
     doc.add_paragraph(
         "The transformed data follows a star schema design with 5 dimension tables "
-        "and 4 fact tables. This design optimizes for analytical queries by denormalising "
+        "and 5 fact tables. This design optimizes for analytical queries by denormalising "
         "data into a structure that minimises joins while maintaining data integrity."
     )
 
@@ -585,7 +585,7 @@ def build_document():
             [
                 "SQL transformations not finalized",
                 "Created 4 transformation scripts with data cleaning, 5 dimension tables, "
-                "4 fact tables, and 5 analytical views.",
+                "5 fact tables, and 5 analytical views.",
             ],
             [
                 "Data validation not consistent across environments",
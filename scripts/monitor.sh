@@ -66,10 +66,10 @@ WHERE table_schema = '${MYSQL_DATABASE}'
 
 echo "  Staging tables:  9 expected"
 echo "  Dimension tables: ${DIM_COUNT} / 5 created"
-echo "  Fact tables:      ${FACT_COUNT} / 4 created"
+echo "  Fact tables:      ${FACT_COUNT} / 5 created"
 echo "  Analytical views: ${VIEW_COUNT} / 5 created"
 
-if [ "$FACT_COUNT" -ge 4 ] && [ "$DIM_COUNT" -ge 5 ] && [ "$VIEW_COUNT" -ge 5 ]; then
+if [ "$FACT_COUNT" -ge 5 ] && [ "$DIM_COUNT" -ge 5 ] && [ "$VIEW_COUNT" -ge 5 ]; then
     echo "  Overall: ALL PIPELINE STAGES COMPLETE"
 else
     echo "  Overall: PIPELINE INCOMPLETE – run 'make pipeline' to execute"
@@ -10,6 +10,9 @@
 #   4. Load CSV data into staging tables
 #   5. Run SQL transformations (clean → dim → fact → views)
 #   6. Run data validation checks
+#
+# Set SAMPLE_PCT (1-99) to load a deterministic sample of orders instead of
+# the full dataset – see sample_data.sh. Default 100 = full dataset.
 ###############################################################################
 
 set -e
@@ -99,6 +102,18 @@ done
 FILE_COUNT=$(ls -1 "${DATA_DIR}"/olist_*.csv "${DATA_DIR}"/product_*.csv 2>/dev/null | wc -l)
 log "  ${FILE_COUNT} CSV files ready in ${DATA_DIR}."
 
+# Optional: deterministic sample for fast development runs
+SAMPLE_PCT="${SAMPLE_PCT:-100}"
+LOAD_DIR="$DATA_DIR"
+if [ "$SAMPLE_PCT" != "100" ]; then
+    log "  Sampling ${SAMPLE_PCT}% of orders..."
+    if ! DATA_DIR="$DATA_DIR" SAMPLE_PCT="$SAMPLE_PCT" sh /scripts/sample_data.sh >> "$LOG_FILE" 2>&1; then
+        log_error "Failed to build ${SAMPLE_PCT}% sample"
+        exit 1
+    fi
+    LOAD_DIR="${DATA_DIR}/sample_${SAMPLE_PCT}"
+fi
+
 # ── Step 2: Wait for MySQL ────────────────────────────────────────────────
 log "STEP 2 – Waiting for MySQL to be ready..."
 ATTEMPTS=0
@@ -118,8 +133,29 @@ log "MySQL is ready (${ATTEMPTS} wait cycles)."
 # ── Step 3: Load data ────────────────────────────────────────────────────
 log "STEP 3 – Loading CSV data into staging tables..."
 LOAD_START=$(date +%s)
-mysql -h "$MYSQL_HOST" -u root -p"$MYSQL_ROOT_PASSWORD" "$MYSQL_DATABASE" \
-    < /sql/load/002_load_data.sql 2>> "$LOG_FILE"
+# LOAD DATA ... IGNORE only adds rows, so staging must be cleared whenever
+# this load differs from the previous one (full ↔ sample, or another
+# sample); otherwise leftover rows would leak in, geolocation rows would be
+# duplicated, and reused review_ids could keep the wrong row.
+# The marker is set to "incomplete" before anything is touched, so a load
+# that fails partway always forces a truncate on the next run.
+LAST_LOAD_FILE="${DATA_DIR}/.last_load"
+LAST_LOAD=$(cat "$LAST_LOAD_FILE" 2>/dev/null || true)
+echo "incomplete" > "$LAST_LOAD_FILE"
+if [ "$LOAD_DIR" != "$DATA_DIR" ] || \
+   { [ -n "$LAST_LOAD" ] && [ "$LAST_LOAD" != "$LOAD_DIR" ]; }; then
+    log "  Truncating staging tables (previous load: ${LAST_LOAD:-none}), loading from ${LOAD_DIR}"
+    mysql -h "$MYSQL_HOST" -u root -p"$MYSQL_ROOT_PASSWORD" "$MYSQL_DATABASE" -e "
+        TRUNCATE stg_customers;      TRUNCATE stg_orders;
+        TRUNCATE stg_order_items;    TRUNCATE stg_order_payments;
+        TRUNCATE stg_order_reviews;  TRUNCATE stg_products;
+        TRUNCATE stg_sellers;        TRUNCATE stg_geolocation;
+        TRUNCATE stg_category_translation;" 2>> "$LOG_FILE"
+fi
+sed "s#'${DATA_DIR}/#'${LOAD_DIR}/#" /sql/load/002_load_data.sql | \
+    mysql -h "$MYSQL_HOST" -u root -p"$MYSQL_ROOT_PASSWORD" "$MYSQL_DATABASE" \
+    2>> "$LOG_FILE"
+echo "$LOAD_DIR" > "$LAST_LOAD_FILE"
 LOAD_END=$(date +%s)
 log "  Data loaded in $((LOAD_END - LOAD_START)) seconds."
 
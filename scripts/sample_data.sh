@@ -0,0 +1,117 @@
+#!/bin/sh
+###############################################################################
+# sample_data.sh – Build a deterministic, referentially consistent sample
+#
+# Keeps SAMPLE_PCT% of orders, chosen by hashing order_id, together with
+# every item, payment and review of those orders and the customers,
+# products, sellers and geolocation zips they reference. The result is a
+# complete set of CSVs in ${DATA_DIR}/sample_${SAMPLE_PCT}/ that
+# 002_load_data.sql can load unchanged. An existing sample is reused as
+# long as the source CSVs (checksum + size) have not changed since it was built.
+#
+# Usage (normally called by run_pipeline.sh):
+#   SAMPLE_PCT=10 sh /scripts/sample_data.sh
+###############################################################################
+
+set -e
+
+DATA_DIR="${DATA_DIR:-/data/raw}"
+SAMPLE_PCT="${SAMPLE_PCT:-100}"
+SAMPLE_DIR="${DATA_DIR}/sample_${SAMPLE_PCT}"
+
+case "$SAMPLE_PCT" in
+    ''|*[!0-9]*) echo "ERROR: SAMPLE_PCT must be an integer 1-100 (got '${SAMPLE_PCT}')" >&2; exit 1 ;;
+esac
+if [ "$SAMPLE_PCT" -lt 1 ] || [ "$SAMPLE_PCT" -gt 100 ]; then
+    echo "ERROR: SAMPLE_PCT must be an integer 1-100 (got '${SAMPLE_PCT}')" >&2
+    exit 1
+fi
+
+SOURCES="
+    ${DATA_DIR}/olist_orders_dataset.csv
+    ${DATA_DIR}/olist_order_items_dataset.csv
+    ${DATA_DIR}/olist_order_payments_dataset.csv
+    ${DATA_DIR}/olist_order_reviews_dataset.csv
+    ${DATA_DIR}/olist_customers_dataset.csv
+    ${DATA_DIR}/olist_products_dataset.csv
+    ${DATA_DIR}/olist_sellers_dataset.csv
+    ${DATA_DIR}/olist_geolocation_dataset.csv
+    ${DATA_DIR}/product_category_name_translation.csv"
+
+# Content fingerprint of the inputs; a re-download with new data (e.g. a new
+# RELEASE_TAG) changes it. mtimes are not used because run_pipeline.sh runs
+# dos2unix over every CSV on each run, which rewrites them in place.
+# shellcheck disable=SC2086
+FINGERPRINT=$(cksum $SOURCES)
+
+if [ -f "${SAMPLE_DIR}/.complete" ] && \
+   [ "$(cat "${SAMPLE_DIR}/.complete")" = "$FINGERPRINT" ]; then
+    echo "  [skip] sample_${SAMPLE_PCT} already exists"
+    exit 0
+fi
+
+# Build into a scratch directory and rename at the end, so an interrupted
+# run never leaves a partial sample behind to be reused.
+BUILD_DIR="${SAMPLE_DIR}.tmp"
+rm -rf "$BUILD_DIR"
+mkdir -p "$BUILD_DIR"
+
+# File order (see SOURCES) matters: orders decide the sample, the files after them keep
+# only rows reachable from what has already been kept.
+awk -v pct="$SAMPLE_PCT" -v out="$BUILD_DIR" '
+BEGIN {
+    for (i = 32; i < 127; i++) ord[sprintf("%c", i)] = i
+}
+# Polynomial string hash → bucket 0-99. Stable across awk implementations.
+function bucket(s,    h, i) {
+    h = 0
+    for (i = 1; i <= length(s); i++) h = (h * 31 + ord[substr(s, i, 1)]) % 1000003
+    return h % 100
+}
+function field(n,    f) {
+    split(rec, f, ",")
+    gsub(/"/, "", f[n])
+    return f[n]
+}
+FNR == 1 {
+    name = FILENAME; sub(/.*\//, "", name)
+    dest = out "/" name
+    pending = ""
+    print > dest
+    next
+}
+{
+    # Quoted fields (review comments) may span several physical lines
+    rec = (pending == "") ? $0 : pending "\n" $0
+    if (gsub(/"/, "\"", rec) % 2) { pending = rec; next }
+    pending = ""
+}
+name == "olist_orders_dataset.csv" {
+    if (bucket(field(1)) >= pct) next
+    orders[field(1)] = 1
+    customers[field(2)] = 1
+}
+name == "olist_order_items_dataset.csv" {
+    if (!(field(1) in orders)) next
+    products[field(3)] = 1
+    sellers[field(4)] = 1
+}
+name == "olist_order_payments_dataset.csv" && !(field(1) in orders) { next }
+name == "olist_order_reviews_dataset.csv"  && !(field(2) in orders) { next }
+name == "olist_customers_dataset.csv" {
+    if (!(field(1) in customers)) next
+    zips[field(3)] = 1
+}
+name == "olist_products_dataset.csv" && !(field(1) in products) { next }
+name == "olist_sellers_dataset.csv" {
+    if (!(field(1) in sellers)) next
+    zips[field(2)] = 1
+}
+name == "olist_geolocation_dataset.csv" && !(field(1) in zips) { next }
+{ print rec > dest }
+' $SOURCES
+
+echo "$FINGERPRINT" > "${BUILD_DIR}/.complete"
+rm -rf "$SAMPLE_DIR"
+mv "$BUILD_DIR" "$SAMPLE_DIR"
+echo "  Built sample_${SAMPLE_PCT} ($(($(wc -l < "${SAMPLE_DIR}/olist_orders_dataset.csv") - 1)) orders)"
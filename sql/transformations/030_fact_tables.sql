@@ -1,7 +1,7 @@
 -- ============================================================================
 -- 030_fact_tables.sql
 -- Creates and populates fact tables for the star schema.
--- Facts: orders, order_items, payments, reviews
+-- Facts: orders, order_items, payments, reviews, delivery_by_distance
 -- ============================================================================
 
 USE olist_dw;
@@ -82,6 +82,45 @@ LEFT JOIN (
     GROUP BY order_id
 ) pay ON o.order_id = pay.order_id;
 
+-- ═══════════════════════════════════════════════════════════════════════════
+-- tmp_zip_pair_distance  (seller zip → customer zip haversine cache)
+-- Many line items share the same seller/customer zip pair, so the trig is
+-- evaluated once per distinct pair here and joined back onto the items.
+-- ═══════════════════════════════════════════════════════════════════════════
+DROP TEMPORARY TABLE IF EXISTS tmp_zip_pair_distance;
+CREATE TEMPORARY TABLE tmp_zip_pair_distance (
+    seller_zip_code_prefix    VARCHAR(10) NOT NULL,
+    customer_zip_code_prefix  VARCHAR(10) NOT NULL,
+    distance_km               DECIMAL(8,2),
+    PRIMARY KEY (seller_zip_code_prefix, customer_zip_code_prefix)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT INTO tmp_zip_pair_distance
+    (seller_zip_code_prefix, customer_zip_code_prefix, distance_km)
+SELECT
+    pairs.seller_zip,
+    pairs.customer_zip,
+    -- Haversine great-circle distance, Earth radius 6371 km
+    ROUND(2 * 6371 * ASIN(SQRT(LEAST(1,
+        POW(SIN(RADIANS(gc.avg_latitude - gs.avg_latitude) / 2), 2)
+        + COS(RADIANS(gs.avg_latitude)) * COS(RADIANS(gc.avg_latitude))
+        * POW(SIN(RADIANS(gc.avg_longitude - gs.avg_longitude) / 2), 2)
+    ))), 2)
+FROM (
+    SELECT DISTINCT
+           ds.seller_zip_code_prefix   AS seller_zip,
+           dc.customer_zip_code_prefix AS customer_zip
+    FROM stg_order_items oi
+    JOIN dim_sellers   ds ON oi.seller_id   = ds.seller_id
+    JOIN stg_orders    o  ON oi.order_id    = o.order_id
+    JOIN dim_customers dc ON o.customer_id  = dc.customer_id
+    WHERE ds.seller_zip_code_prefix   IS NOT NULL
+      AND dc.customer_zip_code_prefix IS NOT NULL
+) pairs
+-- Zips missing from geolocation keep a NULL distance
+LEFT JOIN dim_geography gs ON pairs.seller_zip   = gs.zip_code_prefix
+LEFT JOIN dim_geography gc ON pairs.customer_zip = gc.zip_code_prefix;
+
 -- ═══════════════════════════════════════════════════════════════════════════
 -- fact_order_items  (one row per line item)
 -- ═══════════════════════════════════════════════════════════════════════════
@@ -95,6 +134,7 @@ CREATE TABLE fact_order_items (
     shipping_limit_date DATETIME,
     price               DECIMAL(10,2),
     freight_value       DECIMAL(10,2),
+    distance_km         DECIMAL(8,2),   -- seller → customer zip centroids
     INDEX idx_fact_oi_order (order_id),
     INDEX idx_fact_oi_prod  (product_key),
     INDEX idx_fact_oi_sell  (seller_key)
@@ -102,7 +142,7 @@ CREATE TABLE fact_order_items (
 
 INSERT INTO fact_order_items
     (order_id, order_item_id, product_key, seller_key,
-     shipping_limit_date, price, freight_value)
+     shipping_limit_date, price, freight_value, distance_km)
 SELECT
     oi.order_id,
     oi.order_item_id,
@@ -110,10 +150,75 @@ SELECT
     ds.seller_key,
     oi.shipping_limit_date,
     oi.price,
-    oi.freight_value
+    oi.freight_value,
+    zd.distance_km
 FROM stg_order_items oi
 LEFT JOIN dim_products dp ON oi.product_id = dp.product_id
-LEFT JOIN dim_sellers  ds ON oi.seller_id  = ds.seller_id;
+LEFT JOIN dim_sellers  ds ON oi.seller_id  = ds.seller_id
+LEFT JOIN stg_orders   o  ON oi.order_id   = o.order_id
+LEFT JOIN dim_customers dc ON o.customer_id = dc.customer_id
+LEFT JOIN tmp_zip_pair_distance zd
+    ON  zd.seller_zip_code_prefix   = ds.seller_zip_code_prefix
+    AND zd.customer_zip_code_prefix = dc.customer_zip_code_prefix;
+
+DROP TEMPORARY TABLE IF EXISTS tmp_zip_pair_distance;
+
+-- ═══════════════════════════════════════════════════════════════════════════
+-- fact_delivery_by_distance  (delivered orders summarised by distance band)
+-- An order's items are averaged per band first, so every order counts once
+-- per band it ships within. Items without a known distance are excluded.
+-- ═══════════════════════════════════════════════════════════════════════════
+DROP TABLE IF EXISTS fact_delivery_by_distance;
+CREATE TABLE fact_delivery_by_distance (
+    band_order          TINYINT      NOT NULL PRIMARY KEY,
+    distance_band       VARCHAR(20)  NOT NULL,
+    total_orders        INT,
+    total_items         INT,
+    avg_distance_km     DECIMAL(8,2),
+    avg_delivery_days   DECIMAL(6,1),
+    avg_estimated_days  DECIMAL(6,1),
+    late_deliveries     INT,
+    late_pct            DECIMAL(5,1),
+    avg_freight_value   DECIMAL(10,2)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT INTO fact_delivery_by_distance
+    (band_order, distance_band, total_orders, total_items, avg_distance_km,
+     avg_delivery_days, avg_estimated_days, late_deliveries, late_pct,
+     avg_freight_value)
+SELECT
+    ob.band_order,
+    ELT(ob.band_order, '0-50 km', '50-200 km', '200-500 km',
+                       '500-1000 km', '1000-2000 km', '2000+ km'),
+    COUNT(*),
+    SUM(ob.items),
+    ROUND(AVG(ob.distance_km), 2),
+    ROUND(AVG(fo.actual_delivery_days), 1),
+    ROUND(AVG(fo.estimated_delivery_days), 1),
+    SUM(fo.is_late_delivery),
+    ROUND(100.0 * SUM(fo.is_late_delivery) / COUNT(*), 1),
+    ROUND(SUM(ob.freight) / SUM(ob.items), 2)
+FROM (
+    SELECT
+        CASE
+            WHEN fi.distance_km <   50 THEN 1
+            WHEN fi.distance_km <  200 THEN 2
+            WHEN fi.distance_km <  500 THEN 3
+            WHEN fi.distance_km < 1000 THEN 4
+            WHEN fi.distance_km < 2000 THEN 5
+            ELSE 6
+        END                       AS band_order,
+        fi.order_id,
+        COUNT(*)                  AS items,
+        AVG(fi.distance_km)       AS distance_km,
+        SUM(fi.freight_value)     AS freight
+    FROM fact_order_items fi
+    WHERE fi.distance_km IS NOT NULL
+    GROUP BY band_order, fi.order_id
+) ob
+JOIN fact_orders fo ON ob.order_id = fo.order_id
+WHERE fo.order_status = 'delivered'
+GROUP BY ob.band_order;
 
 -- ═══════════════════════════════════════════════════════════════════════════
 -- fact_payments  (one row per payment line)
@@ -169,4 +274,4 @@ SELECT
     review_answer_timestamp
 FROM stg_order_reviews;
 
-SELECT '>>> 030_fact_tables.sql completed – 4 fact tables created' AS status;
+SELECT '>>> 030_fact_tables.sql completed – 5 fact tables created' AS status;
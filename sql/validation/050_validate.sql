@@ -48,7 +48,9 @@ SELECT 'fact_order_items',          COUNT(*) FROM fact_order_items
 UNION ALL
 SELECT 'fact_payments',             COUNT(*) FROM fact_payments
 UNION ALL
-SELECT 'fact_reviews',              COUNT(*) FROM fact_reviews;
+SELECT 'fact_reviews',              COUNT(*) FROM fact_reviews
+UNION ALL
+SELECT 'fact_delivery_by_distance', COUNT(*) FROM fact_delivery_by_distance;
 
 -- ═══════════════════════════════════════════════════════════════════════════
 -- 3. Null checks on critical columns
@@ -100,7 +102,32 @@ SELECT 'payments with negative value',
        COUNT(*) FROM fact_payments WHERE payment_value < 0
 UNION ALL
 SELECT 'reviews with score out of range (1-5)',
-       COUNT(*) FROM fact_reviews WHERE review_score < 1 OR review_score > 5;
+       COUNT(*) FROM fact_reviews WHERE review_score < 1 OR review_score > 5
+UNION ALL
+-- Both zips geocoded but no distance → zip-pair cache join-back is broken
+SELECT 'order_items missing distance_km for geocoded zips',
+       COUNT(*)
+FROM fact_order_items fi
+JOIN dim_sellers   ds ON fi.seller_key   = ds.seller_key
+JOIN fact_orders   fo ON fi.order_id     = fo.order_id
+JOIN dim_customers dc ON fo.customer_key = dc.customer_key
+JOIN dim_geography gs ON ds.seller_zip_code_prefix   = gs.zip_code_prefix
+JOIN dim_geography gc ON dc.customer_zip_code_prefix = gc.zip_code_prefix
+WHERE fi.distance_km IS NULL
+UNION ALL
+-- Known answer: seller in central São Paulo → customer in central Rio is
+-- 348-371 km for any centroids in these boxes. Swapped lat/lng gives ≥375 km
+-- and sign/RADIANS mistakes give thousands. NULL (no such items) also flags.
+SELECT 'order_items São Paulo → Rio centre outside 340-373 km',
+       IF(COUNT(*) = 0, NULL, SUM(fi.distance_km NOT BETWEEN 340 AND 373))
+FROM fact_order_items fi
+JOIN dim_sellers   ds ON fi.seller_key   = ds.seller_key
+JOIN fact_orders   fo ON fi.order_id     = fo.order_id
+JOIN dim_customers dc ON fo.customer_key = dc.customer_key
+JOIN dim_geography gs ON ds.seller_zip_code_prefix   = gs.zip_code_prefix
+JOIN dim_geography gc ON dc.customer_zip_code_prefix = gc.zip_code_prefix
+WHERE gs.avg_latitude  BETWEEN -23.60 AND -23.50 AND gs.avg_longitude BETWEEN -46.70 AND -46.60
+  AND gc.avg_latitude  BETWEEN -22.95 AND -22.88 AND gc.avg_longitude BETWEEN -43.25 AND -43.15;
 
 -- ═══════════════════════════════════════════════════════════════════════════
 -- 6. Sample output from analytical views
@@ -111,6 +138,9 @@ SELECT * FROM vw_monthly_revenue LIMIT 5;
 SELECT '=== SAMPLE: DELIVERY PERFORMANCE (top 5) ===' AS section;
 SELECT * FROM vw_delivery_performance LIMIT 5;
 
+SELECT '=== SAMPLE: DELIVERY BY DISTANCE BAND ===' AS section;
+SELECT * FROM fact_delivery_by_distance ORDER BY band_order;
+
 SELECT '=== SAMPLE: TOP SELLERS (top 5) ===' AS section;
 SELECT seller_city, seller_state, total_orders, total_revenue, avg_review_score
 FROM vw_seller_performance LIMIT 5;
@@ -0,0 +1,199 @@
+#!/bin/sh
+###############################################################################
+# run_tests.sh – Batched integration test runner
+#
+# Runs inside the Alpine-based pipeline container (no Docker CLI needed).
+# Assertions are declared as data in tests/assertions.txt and compiled into
+# SQL batches; each batch is sent over a single MySQL connection, and
+# batches run in parallel when TEST_JOBS > 1. Per-assertion timing is taken
+# server-side with SYSDATE(6), and a JUnit XML report is written at the end.
+#
+# Usage (from host):
+#   docker compose run --rm pipeline sh /tests/run_tests.sh
+#   make test
+#
+# Environment:
+#   TEST_JOBS    Parallel connections to spread assertions over (default: 1)
+#   TEST_REPORT  JUnit XML output path (default: /logs/test_results.xml;
+#                test_pipeline.sh sets it to ./test-results/ on the host)
+###############################################################################
+
+set -e
+
+TESTS_DIR=$(cd "$(dirname "$0")" && pwd)
+ASSERTIONS="${TEST_ASSERTIONS:-${TESTS_DIR}/assertions.txt}"
+TEST_JOBS="${TEST_JOBS:-1}"
+TEST_REPORT="${TEST_REPORT:-/logs/test_results.xml}"
+
+case "$TEST_JOBS" in
+    ''|*[!0-9]*|0) TEST_JOBS=1 ;;
+esac
+
+# Colours for output
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+NC='\033[0m'  # No colour
+
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# The pipeline container starts from a bare Alpine image, so the client is
+# installed on each run (needs network access to the Alpine mirrors)
+if ! command -v mysql > /dev/null 2>&1; then
+    if ! apk add --no-cache mysql-client > /dev/null 2>&1; then
+        printf "${RED}  ERROR${NC} Could not install mysql-client (apk add failed – no network?)\n"
+        exit 1
+    fi
+fi
+
+MYSQL_CMD="mysql -h ${MYSQL_HOST:-127.0.0.1} -u root -p${MYSQL_ROOT_PASSWORD:-rootpass507} ${MYSQL_DATABASE:-olist_dw}"
+
+echo "============================================="
+echo "  ADS-507 Pipeline – Integration Tests"
+echo "============================================="
+echo ""
+
+# ── 1. Compile assertions into one SQL batch per connection ──────────────
+# Every assertion becomes exactly two lines (timer reset + SELECT), and the
+# .map file records which batch line belongs to which assertion so that
+# "ERROR ... at line N" messages can be attributed back to it.
+awk -v jobs="$TEST_JOBS" -v dir="$WORK_DIR" '
+function trim(s) { gsub(/^[ \t]+|[ \t]+$/, "", s); return s }
+/^[ \t]*(#|$)/ { next }
+{
+    # The query is everything after the fourth "|", so it may contain "|"
+    query = $0
+    for (i = 1; i <= 4; i++) query = substr(query, index(query, "|") + 1)
+    query = trim(query)
+    sub(/;$/, "", query)
+    n++
+    k = (n - 1) % jobs + 1
+    batch = dir "/batch_" k
+    print "SET @t := SYSDATE(6);" > (batch ".sql")
+    print "SELECT " n ", (" query "), TIMESTAMPDIFF(MICROSECOND, @t, SYSDATE(6));" > (batch ".sql")
+    lines[k] += 2
+    print lines[k], n > (batch ".map")
+}' "$ASSERTIONS"
+
+# ── 2. Run batches (one connection each, in parallel) ────────────────────
+START=$(date +%s)
+CONNECTIONS=0
+for batch in "$WORK_DIR"/batch_*.sql; do
+    CONNECTIONS=$((CONNECTIONS + 1))
+    $MYSQL_CMD -N -B --force < "$batch" \
+        > "${batch%.sql}.out" 2> "${batch%.sql}.err" &
+done
+wait
+END=$(date +%s)
+
+# Errors without a line number mean the connection itself failed
+CONN_ERR=$(cat "$WORK_DIR"/batch_*.err | grep '^ERROR' | grep -v ' at line ' | head -1 || true)
+if [ -n "$CONN_ERR" ]; then
+    printf "${RED}  FAIL${NC} Cannot connect to MySQL (%s)\n" "$CONN_ERR"
+    echo "Cannot proceed without MySQL. Exiting."
+    exit 1
+fi
+
+# ── 3. Evaluate results, print report, write JUnit XML ───────────────────
+mkdir -p "$(dirname "$TEST_REPORT")"
+STATUS=0
+awk -v report="$TEST_REPORT" -v green="$GREEN" -v red="$RED" -v nc="$NC" '
+function trim(s) { gsub(/^[ \t]+|[ \t]+$/, "", s); return s }
+function xml(s) {
+    gsub(/&/, "\\&amp;", s); gsub(/</, "\\&lt;", s)
+    gsub(/>/, "\\&gt;", s);  gsub(/"/, "\\&quot;", s)
+    return s
+}
+FILENAME ~ /\.map$/ {
+    batch = FILENAME; sub(/\.map$/, "", batch)
+    owner[batch, $1] = $2
+    next
+}
+FILENAME ~ /\.err$/ {
+    if ($0 !~ /^ERROR/ || !match($0, / at line [0-9]+:/)) next
+    batch = FILENAME; sub(/\.err$/, "", batch)
+    err[owner[batch, substr($0, RSTART + 9, RLENGTH - 10)]] = $0
+    next
+}
+FILENAME ~ /\.out$/ {
+    split($0, r, "\t")
+    got[r[1]] = r[2]
+    usec[r[1]] = r[3]
+    next
+}
+/^[ \t]*(#|$)/ { next }
+{
+    split($0, f, "|")
+    suite = trim(f[1]); desc = trim(f[2]); op = trim(f[3]); want = trim(f[4])
+    n++
+
+    if (suite != last) {
+        if (n > 1) print ""
+        printf "── %s ", suite
+        for (i = length(suite); i < 62; i++) printf "─"
+        printf "\n"
+        if (!(suite in seen)) { order[++nsuites] = suite; seen[suite] = 1 }
+        last = suite
+    }
+
+    secs = (n in usec) ? usec[n] / 1000000 : 0
+    ms = secs * 1000
+    if (!(n in got)) {
+        status = "error"
+        detail = (n in err) ? err[n] : "query returned no result"
+    } else if (op == "eq") {
+        status = (got[n] == want) ? "pass" : "failure"
+        detail = "expected: " want ", got: " got[n]
+        shown = "got: " got[n]
+    } else if (op == "gt") {
+        status = (got[n] ~ /^-?[0-9]+(\.[0-9]+)?$/ && got[n] + 0 > want + 0) ? "pass" : "failure"
+        detail = "expected > " want ", got: " got[n]
+        shown = "got: " got[n] " > " want
+    } else {
+        status = "error"
+        detail = "unknown op \"" op "\""
+    }
+
+    tc = sprintf("    <testcase classname=\"%s\" name=\"%s\" time=\"%.6f\"", xml(suite), xml(desc), secs)
+    if (status == "pass") {
+        printf "%s  PASS%s %s (%s) [%.1f ms]\n", green, nc, desc, shown, ms
+        passed++
+        tc = tc "/>"
+    } else {
+        printf "%s  %s%s %s (%s) [%.1f ms]\n", red, (status == "error") ? "ERROR" : "FAIL", nc, desc, detail, ms
+        if (status == "error") { errors++; suite_errors[suite]++ }
+        else                   { failures++; suite_failures[suite]++ }
+        tc = tc ">\n      <" status " message=\"" xml(detail) "\"/>\n    </testcase>"
+    }
+    cases[suite] = cases[suite] tc "\n"
+    suite_tests[suite]++
+    suite_time[suite] += secs
+    total_time += secs
+}
+END {
+    print "<?xml version=\"1.0\" encoding=\"UTF-8\"?>" > report
+    printf "<testsuites name=\"ads507-pipeline\" tests=\"%d\" failures=\"%d\" errors=\"%d\" time=\"%.6f\">\n", \
+        n, failures, errors, total_time > report
+    for (i = 1; i <= nsuites; i++) {
+        s = order[i]
+        printf "  <testsuite name=\"%s\" tests=\"%d\" failures=\"%d\" errors=\"%d\" time=\"%.6f\">\n", \
+            xml(s), suite_tests[s], suite_failures[s], suite_errors[s], suite_time[s] > report
+        printf "%s", cases[s] > report
+        print "  </testsuite>" > report
+    }
+    print "</testsuites>" > report
+    close(report)
+
+    print ""
+    print "============================================="
+    printf "  Results: %s%d passed%s, %s%d failed%s, %d total\n", \
+        green, passed, nc, red, failures + errors, nc, n
+    printf "  Query time: %.1f ms\n", total_time * 1000
+    exit (failures + errors > 0)
+}' "$WORK_DIR"/batch_*.map "$WORK_DIR"/batch_*.err "$WORK_DIR"/batch_*.out "$ASSERTIONS" || STATUS=$?
+
+echo "  Wall time:  $((END - START))s over ${CONNECTIONS} connection(s)"
+echo "  Report:     ${TEST_REPORT}"
+echo "============================================="
+
+exit "$STATUS"